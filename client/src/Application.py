@@ -1,4 +1,5 @@
 import json
+import queue
 import threading
 from .Communicator import Communicator
 from .View import Viewer
@@ -7,7 +8,7 @@ from .ConfigManager import ConfigManager
 
 from .utils import (
     STR_DOMAINS, STR_OPERATION,
-    Codes
+    Codes, json_loads
 )
 
 class Application:
@@ -30,6 +31,26 @@ class Application:
         self._view = Viewer(config_manager=self._config_manager, message_callback=self._handle_request)
         self._communicator = Communicator(config_manager=self._config_manager, message_callback=self._handle_request)
 
+        # Dispatch table for server responses, mirroring the handler map the
+        # server's RequestFactory uses for the opposite direction.
+        self._response_handlers = {
+            Codes.CODE_INIT_SETTINGS:      self._view.update_initial_settings,
+            Codes.CODE_AD_BLOCK:           self._view.ad_block_response,
+            Codes.CODE_ADULT_BLOCK:        self._view.adult_block_response,
+            Codes.CODE_ADD_DOMAIN:         self._view.add_domain_response,
+            Codes.CODE_REMOVE_DOMAIN:      self._view.remove_domain_response,
+            Codes.CODE_DOMAIN_LIST_UPDATE: self._handle_domain_list_update,
+        }
+
+        # Outbound sends run on their own thread so a slow socket never
+        # blocks the Tk thread inside sendall.
+        self._send_queue: queue.Queue = queue.Queue()
+        threading.Thread(
+            target=self._sender_loop,
+            name="communicator-send",
+            daemon=True
+        ).start()
+
     def run(self) -> None:
         """
         Start the application with threaded communication handling.
@@ -50,18 +71,26 @@ class Application:
             self._cleanup()
 
     def _start_communication(self) -> None:
-        """Initialize and start the communication thread."""
+        """Start the communication thread without blocking the GUI thread."""
+        threading.Thread(
+            target=self._communication_loop,
+            name="communicator-recv",
+            daemon=True
+        ).start()
+
+        self._logger.info("Communication thread started")
+
+    def _communication_loop(self) -> None:
+        """Connect to the server and run the receive loop.
+
+        Runs on the communication thread so a slow or unreachable server
+        never delays GUI startup.
+        """
         try:
             self._communicator.connect()
-            threading.Thread(
-                target=self._communicator.receive_message,
-                daemon=True
-            ).start()
-            
-            self._logger.info("Communication server started successfully")
+            self._communicator.receive_message()
         except Exception as e:
-            self._logger.error(f"Failed to start communication: {str(e)}")
-            raise
+            self._logger.error(f"Communication thread stopped: {str(e)}")
 
     def _start_gui(self) -> None:
         """Start the GUI main loop."""
@@ -81,28 +110,26 @@ class Application:
             request: received request from server or user input from UI.
         """
         try:
-            self._logger.info(f"Processing request: {request}")
-            request_dict = json.loads(request)
-            
+            self._logger.info("Processing request: %s", request)
+
             if to_server:
-                message = request if isinstance(request, dict) else json.loads(request)
-                self._communicator.send_message(message)
+                # UI requests arrive already serialized; hand the string to
+                # the sender thread and return to the event loop at once.
+                self._send_queue.put(request)
                 return
+
+            request_dict = json_loads(request)
             
-            match request_dict[STR_OPERATION]:
-                case Codes.CODE_INIT_SETTINGS:
-                    self._view.update_initial_settings(request_dict)
-                case Codes.CODE_AD_BLOCK:
-                    self._view.ad_block_response(request_dict)
-                case Codes.CODE_ADULT_BLOCK:
-                    self._view.adult_block_response(request_dict)
-                case Codes.CODE_ADD_DOMAIN:
-                    self._view.add_domain_response(request_dict)
-                case Codes.CODE_REMOVE_DOMAIN:
-                    self._view.remove_domain_response(request_dict)
-                case Codes.CODE_DOMAIN_LIST_UPDATE:
-                    self._view.update_domain_list_response(request_dict[STR_DOMAINS])
-                        
+            handler = self._response_handlers.get(request_dict[STR_OPERATION])
+            if handler:
+                # Tk widgets may only be touched from the main thread, and
+                # inbound responses arrive on the receive thread - marshal
+                # every view update through the Tk event queue.
+                self._view.root.after(0, handler, request_dict)
+            else:
+                self._logger.warning("Unknown operation: %s", request_dict[STR_OPERATION])
+
+
         except json.JSONDecodeError as e:
             self._logger.error(f"Invalid JSON format: {str(e)}")
             raise
@@ -110,6 +137,21 @@ class Application:
             self._logger.error(f"Error handling request: {str(e)}")
             raise
 
+    def _sender_loop(self) -> None:
+        """Drain the send queue, forwarding each request to the server."""
+        while True:
+            request = self._send_queue.get()
+            try:
+                self._communicator.send_message(request)
+            except Exception as e:
+                self._logger.error(f"Failed to send request: {str(e)}")
+            finally:
+                self._send_queue.task_done()
+
+    def _handle_domain_list_update(self, request_dict: dict) -> None:
+        """Forward the domain list payload to the view."""
+        self._view.update_domain_list_response(request_dict[STR_DOMAINS])
+
     def _cleanup(self) -> None:
         """Clean up resources and stop threads."""
         self._logger.info("Cleaning up application resources")
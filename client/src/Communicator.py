@@ -1,5 +1,7 @@
+import selectors
 import socket
-from typing import Optional, Callable
+from functools import lru_cache
+from typing import Optional, Callable, Union
 import json
 from .Logger import setup_logger
 from .utils import (
@@ -7,6 +9,16 @@ from .utils import (
     STR_NETWORK, STR_HOST, STR_PORT, STR_RECEIVE_BUFFER_SIZE
 )
 
+@lru_cache(maxsize=32)
+def _encode_frame(payload: str) -> bytes:
+    """
+    Encode a serialized request into an on-wire frame.
+
+    The control vocabulary is tiny (toggles and a handful of domains), so
+    repeated messages reuse their cached frame instead of re-encoding.
+    """
+    return payload.encode('utf-8') + b'\n'
+
 class Communicator:
     def __init__(self, config_manager, message_callback: Callable[[str], None]) -> None:
         """
@@ -25,6 +37,7 @@ class Communicator:
         self._port = int(self.config[STR_NETWORK][STR_PORT])
         self._receive_buffer_size = int(self.config[STR_NETWORK][STR_RECEIVE_BUFFER_SIZE])
         self._socket: Optional[socket.socket] = None
+        self._running = False
 
     def connect(self) -> None:
         """
@@ -35,27 +48,33 @@ class Communicator:
         """
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            if hasattr(socket, 'TCP_NODELAY'):
+                # Disable Nagle's algorithm - small JSON control messages
+                # should go out immediately instead of being coalesced.
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self._socket.connect((self._host, self._port))
             self.logger.info(f"Connected to server at {self._host}:{self._port}")
         except socket.error as e:
             self.logger.error(f"Failed to connect to server: {str(e)}")
             raise
 
-    def send_message(self, request: dict) -> None:
+    def send_message(self, request: Union[dict, str]) -> None:
         """
         Send a json request to the server.
-        
+
         Args:
-            request: The request to send to the server.
-            
+            request: The request to send, either a dict or an
+                already-serialized JSON string.
+
         Raises:
             RuntimeError: If socket connection is not established.
         """
         self._validate_connection()
 
         try:
-            self._socket.send(json.dumps(request).encode('utf-8'))
-            self.logger.info(f"Request sent: {request}")
+            payload = request if isinstance(request, str) else json.dumps(request)
+            self._socket.sendall(_encode_frame(payload))
+            self.logger.info("Request sent: %s", request)
         except Exception as e:
             self.logger.error(f"Failed to send request: {str(e)}")
             raise
@@ -63,8 +82,10 @@ class Communicator:
     def receive_message(self) -> None:
         """Continuously receive and process messages from the socket connection.
 
-        This method runs in a loop to receive messages from the socket. Each received
-        message is decoded from UTF-8 and passed to the message callback function.
+        TCP is a stream, so a single recv may carry several server messages or
+        only part of one. Received bytes are buffered and split on the newline
+        delimiter the server appends to every message, and the callback is
+        invoked once per complete message.
 
         Raises:
             RuntimeError: If socket connection is not established.
@@ -74,20 +95,44 @@ class Communicator:
         self._validate_connection()
 
         self.logger.info("Starting message receive loop")
+        buffer = bytearray()
+        # Reuse one receive buffer instead of letting recv allocate a
+        # fresh bytes object for every read.
+        chunk = bytearray(self._receive_buffer_size)
+        chunk_view = memoryview(chunk)
+        # Bind hot-loop attribute lookups to locals once.
+        recv_into = self._socket.recv_into
+        callback = self._message_callback
+        self._running = True
+        selector = selectors.DefaultSelector()
+        selector.register(self._socket, selectors.EVENT_READ)
         try:
-            while message_bytes := self._socket.recv(self._receive_buffer_size):
-                if not message_bytes:
-                    self.logger.warning("Received empty message, breaking receive loop")
+            while self._running:
+                # Wake up periodically so close() can stop the loop.
+                if not selector.select(timeout=1.0):
+                    continue
+                received = recv_into(chunk)
+                if not received:
+                    self.logger.info("Server closed the connection")
                     break
-                message = message_bytes.decode('utf-8')
-                self.logger.info(f"Received message: {message}")
-                self._message_callback(message, False)
+                buffer.extend(chunk_view[:received])
+                while (delimiter := buffer.find(b'\n')) != -1:
+                    frame = buffer[:delimiter]
+                    del buffer[:delimiter + 1]
+                    if not frame:
+                        continue
+                    message = frame.decode('utf-8')
+                    self.logger.debug("Received message: %s", message)
+                    callback(message, False)
         except Exception as e:
             self.logger.error(f"Error receiving message: {str(e)}")
             raise
+        finally:
+            selector.close()
 
     def close(self) -> None:
         """Close the socket connection and clean up resources."""
+        self._running = False
         if self._socket:
             try:
                 self._socket.close()
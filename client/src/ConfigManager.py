@@ -1,15 +1,28 @@
 """Configuration management module for the application."""
 
+import copy
 import json
 import os
-from typing import Dict, Any
+import queue
+import tempfile
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from .Logger import setup_logger
-from .utils import DEFAULT_CONFIG
+from .utils import DEFAULT_CONFIG, json_loads
+
+# Reused for every save; json.dumps builds a fresh encoder per call.
+_CONFIG_ENCODER = json.JSONEncoder(indent=4)
 
 
 class ConfigManager:
     """Manages application configuration loading and saving."""
-    
+
+    __slots__ = (
+        'logger', 'config_file', 'config', '_config_view', '_last_saved',
+        '_save_queue'
+    )
+
     def __init__(self, config_file: str = "config.json") -> None:
         """
         Initialize the configuration manager.
@@ -20,6 +33,18 @@ class ConfigManager:
         self.logger = setup_logger(__name__)
         self.config_file = config_file
         self.config = self._load_config()
+        self._config_view = MappingProxyType(self.config)
+        self._last_saved = copy.deepcopy(self.config)
+
+        # Disk writes run on their own thread so callers on the Tk thread
+        # never block on I/O. A one-slot queue coalesces bursts of saves:
+        # only the most recent snapshot is ever written.
+        self._save_queue: queue.Queue = queue.Queue(maxsize=1)
+        threading.Thread(
+            target=self._save_loop,
+            name="config-writer",
+            daemon=True
+        ).start()
     
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -29,59 +54,129 @@ class ConfigManager:
             Dict containing configuration settings.
         """
         try:
-            if os.path.exists(self.config_file):
+            # Open directly instead of stat-ing first; missing files are
+            # the expected first-run case and land in FileNotFoundError.
+            with open(self.config_file, 'rb') as f:
                 self.logger.info(f"Loading configuration from {self.config_file}")
-                with open(self.config_file, 'r') as f:
-                    user_config = json.load(f)
-                    return self._merge_configs(DEFAULT_CONFIG, user_config)
+                user_config = json_loads(f.read())
+                return self._merge_configs(copy.deepcopy(DEFAULT_CONFIG), user_config)
 
+        except FileNotFoundError:
             self.logger.warning(f"Configuration file not found, using default configuration")
-            
+
         except json.JSONDecodeError:
             self.logger.error(f"Error decoding {self.config_file}, using default configuration")
         
-        return DEFAULT_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_CONFIG)
     
     def _merge_configs(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively merge user configuration with default configuration.
-        
+        Merge user configuration with default configuration.
+
+        Uses an explicit stack instead of recursion, so deeply nested
+        configs cost no Python call frames per level.
+
         Args:
             default: Default configuration dictionary
             user: User configuration dictionary
-            
+
         Returns:
             Merged configuration dictionary
         """
         result = default.copy()
-        
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
-                
+        stack = [(result, user)]
+
+        while stack:
+            target, overrides = stack.pop()
+            for key, value in overrides.items():
+                existing = target.get(key)
+                if isinstance(existing, dict) and isinstance(value, dict):
+                    merged = existing.copy()
+                    target[key] = merged
+                    stack.append((merged, value))
+                else:
+                    target[key] = value
+
         return result
     
     def save_config(self, config: Dict[str, Any]) -> None:
         """
         Save configuration to JSON file.
-        
+
+        Writes that would not change the file on disk are skipped, so
+        repeated saves of the same settings cost nothing.
+
         Args:
             config: Configuration dictionary to save
         """
+        if config == self._last_saved:
+            self.logger.debug("Configuration unchanged, skipping write")
+            return
+
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            # Write to a sibling temp file and rename it over the config so
+            # a crash mid-write can never leave a truncated config behind.
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.config_file)),
+                suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(_CONFIG_ENCODER.encode(config))
+                    # One flush+fsync for the whole file before the rename,
+                    # so the replace never publishes partially-flushed data.
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_file)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            self._last_saved = copy.deepcopy(config)
             self.logger.info("Configuration saved successfully")
         except Exception as e:
             self.logger.error(f"Error saving configuration: {str(e)}")
     
-    def get_config(self) -> Dict[str, Any]:
+    def save_config_async(self, config: Dict[str, Any]) -> None:
+        """
+        Queue a configuration snapshot for saving on the writer thread.
+
+        If a save is already pending it is replaced, so a burst of UI
+        events collapses into a single disk write of the latest state.
+
+        Args:
+            config: Configuration dictionary to save
+        """
+        snapshot = copy.deepcopy(config)
+        try:
+            self._save_queue.put_nowait(snapshot)
+        except queue.Full:
+            try:
+                self._save_queue.get_nowait()
+                self._save_queue.task_done()
+            except queue.Empty:
+                pass
+            self._save_queue.put_nowait(snapshot)
+
+    def flush(self) -> None:
+        """Block until all queued configuration saves reach disk."""
+        self._save_queue.join()
+
+    def _save_loop(self) -> None:
+        """Drain the save queue, writing each snapshot to disk."""
+        while True:
+            config = self._save_queue.get()
+            try:
+                self.save_config(config)
+            finally:
+                self._save_queue.task_done()
+
+    def get_config(self) -> Mapping[str, Any]:
         """
         Get the current configuration.
-        
+
         Returns:
-            Current configuration dictionary
+            Read-only view of the current configuration. Callers share one
+            mapping instead of receiving copies, and accidental writes from
+            consumers raise TypeError instead of corrupting shared state.
         """
-        return self.config
+        return self._config_view
@@ -2,44 +2,80 @@
 
 import logging
 import os
-from datetime import datetime
-from typing import Optional
-from .utils import LOG_DIR, LOG_FORMAT, LOG_DATE_FORMAT
+import time
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from typing import Dict
+from .utils import (
+    LOG_DIR, LOG_FORMAT, LOG_DATE_FORMAT,
+    LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_BUFFER_RECORDS
+)
 
-_logger: Optional[logging.Logger] = None
+_loggers: Dict[str, logging.Logger] = {}
+_configured = False
 
 def setup_logger(name: str) -> logging.Logger:
     """
     Configure and return a logger instance.
-    
+
+    Loggers are cached per name, so repeated calls from the same module
+    are a single dict lookup.
+
     Args:
         name: The name of the module requesting the logger.
-        
+
     Returns:
         logging.Logger: Configured logger instance.
     """
-    global _logger
-    
-    if _logger is not None:
-        return logging.getLogger(name)
-        
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR)
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+
+    global _configured
+
+    if _configured:
+        logger = logging.getLogger(name)
+        _loggers[name] = logger
+        return logger
+
+    os.makedirs(LOG_DIR, exist_ok=True)
 
     log_file: str = os.path.join(
-        LOG_DIR, f"Client_{datetime.now().strftime(LOG_DATE_FORMAT)}.log"
+        LOG_DIR, f"Client_{time.strftime(LOG_DATE_FORMAT)}.log"
     )
     
+    # The format only uses asctime/name/levelname/message, so skip
+    # collecting thread and process info for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    formatter = logging.Formatter(LOG_FORMAT, style='%')
+
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
     logging.basicConfig(
         level=logging.INFO,
-        format=LOG_FORMAT,
         handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(),
+            # Buffer file writes; warnings and errors flush immediately,
+            # and logging.shutdown flushes the remainder at exit.
+            MemoryHandler(
+                LOG_BUFFER_RECORDS,
+                flushLevel=logging.WARNING,
+                target=file_handler,
+            ),
+            console_handler,
         ],
     )
 
-    _logger = logging.getLogger(name)
-    _logger.info("Logger setup complete")
-    
-    return _logger 
\ No newline at end of file
+    _configured = True
+
+    logger = logging.getLogger(name)
+    logger.info("Logger setup complete")
+    _loggers[name] = logger
+
+    return logger 
\ No newline at end of file
@@ -1,25 +1,60 @@
 import tkinter as tk
+from bisect import bisect_left
+from functools import lru_cache
+from sys import intern
 from tkinter import ttk, messagebox
 from typing import Callable, List
-import json
 from .Logger import setup_logger
 from .ConfigManager import ConfigManager
 
 from .utils import (
     Codes,
-    WINDOW_SIZE, WINDOW_TITLE,
-    ERR_NO_DOMAIN_SELECTED, ERR_DOMAIN_LIST_UPDATE_FAILED,
+    WINDOW_SIZE, WINDOW_TITLE, TOAST_DURATION_MS,
+    ERR_NO_DOMAIN_SELECTED, ERR_DOMAIN_LIST_UPDATE_FAILED, ERR_DUPLICATE_DOMAIN,
     STR_AD_BLOCK, STR_ADULT_BLOCK, STR_CODE, STR_AD_BLOCK_RESPONSE,
-    STR_CONTENT, STR_SETTINGS, STR_ERROR, STR_SUCCESS,
+    STR_CONTENT, STR_SETTINGS, STR_ERROR,
     STR_ADD_DOMAIN_RESPONSE, STR_REMOVE_DOMAIN_REQUEST, STR_ADD_DOMAIN_REQUEST,
     STR_DOMAINS, STR_ADULT_BLOCK_RESPONSE, STR_REMOVE_DOMAIN_RESPONSE,
+    json_dumps,
 )
 
+# Bound once at import; saves attribute lookups in hot handlers.
+_END = tk.END
+_SUCCESS = Codes.CODE_SUCCESS
+_ERROR = Codes.CODE_ERROR
+
+def _is_valid_domain_value(new_value: str) -> bool:
+    """Reject any edit whose resulting entry value contains whitespace.
+
+    Validating the prospective value (%P) rather than the edited
+    substring (%S) covers multi-character pastes and never blocks
+    deletions.
+    """
+    return not any(ch.isspace() for ch in new_value)
+
+@lru_cache(maxsize=32)
+def _build_message(code: str, content: str) -> str:
+    """
+    Serialize a code/content request.
+
+    The UI sends the same handful of payloads repeatedly (two toggle
+    states per feature, recently touched domains), so each unique pair
+    is serialized once and reused afterwards.
+    """
+    return json_dumps({STR_CODE: code, STR_CONTENT: content})
+
 class Viewer:
     """
     Graphical user interface for the application.
     """
 
+    __slots__ = (
+        'logger', 'config_manager', '_message_callback',
+        '_blocked_domains', '_sorted_domains', '_domains_cache',
+        'root', 'domains_listbox', '_domains_var',
+        'domain_entry', '_domain_var', 'ad_var', 'adult_var'
+    )
+
     def __init__(self, config_manager: ConfigManager, message_callback: Callable[[str], None]) -> None:
         """
         Initialize the viewer window and its components.
@@ -31,9 +66,17 @@ class Viewer:
         self.logger = setup_logger(__name__)
         self.logger.info("Initializing Viewer")
         self.config_manager = config_manager
-        self.config = config_manager.get_config()
         self._message_callback = message_callback
 
+        # Mirror of the listbox contents for O(1) membership checks.
+        self._blocked_domains: set[str] = set()
+        # Sorted mirror of the listbox rows; lets responses locate a
+        # domain's row index by bisection instead of trusting the
+        # (possibly stale) widget selection.
+        self._sorted_domains: list[str] = []
+        # Cached result of get_blocked_domains, dropped on any change.
+        self._domains_cache: tuple[str, ...] | None = None
+
         # Initialize root window first
         self.root: tk.Tk = tk.Tk()
         self.root.title(WINDOW_TITLE)
@@ -41,14 +84,7 @@ class Viewer:
         
         self.root.withdraw()  # Hide the window temporarily
         
-        # Configure styles
-        style = ttk.Style()
-        style.configure('TLabelframe', padding=10)
-        style.configure('TLabelframe.Label', font=('Arial', 10, 'bold'))
-        style.configure('TButton', padding=5)
-        style.configure('TRadiobutton', font=('Arial', 10))
-        style.configure('TLabel', font=('Arial', 10))
-        
+        self._configure_styles()
         self._setup_ui()
         
         # Show the window after setup is complete
@@ -63,11 +99,15 @@ class Viewer:
     def get_blocked_domains(self) -> tuple[str, ...]:
         """
         Get the list of currently blocked domains.
-        
+
         Returns:
-            A tuple containing all blocked domains.
+            A tuple containing all blocked domains, built from the
+            Python-side mirror of the listbox - no Tcl query involved.
+            The tuple is cached until the list changes.
         """
-        return self.domains_listbox.get(0, tk.END)
+        if self._domains_cache is None:
+            self._domains_cache = tuple(self._sorted_domains)
+        return self._domains_cache
 
     def get_block_settings(self) -> dict[str, str]:
         """
@@ -91,49 +131,62 @@ class Viewer:
         self.logger.info("Updating domain list from server")
 
         try:
-            self.domains_listbox.delete(0, tk.END)
-            
-            for domain in domains:
-                self.domains_listbox.insert(tk.END, domain)
+            # One variable write replaces the whole list in a single Tcl
+            # call instead of a delete plus one insert per domain.
+            # Intern the domains: the same strings recur in later
+            # responses, so membership checks compare by pointer.
+            domains = tuple(sorted(intern(domain) for domain in domains))
+
+            if domains == self._domains_cache:
+                self.logger.info("Domain list unchanged, skipping refresh")
+                return
+
+            self._domains_var.set(domains)
+            self._blocked_domains = set(domains)
+            self._sorted_domains = list(domains)
+            self._domains_cache = domains
 
         except Exception as e:
             self.logger.error(f"Error updating domain list: {str(e)}")
             self._show_error(ERR_DOMAIN_LIST_UPDATE_FAILED)
             return
         
-        self.logger.info(f"Updated domain list with {len(domains)} domains")
+        self.logger.info("Updated domain list with %d domains", len(domains))
         
     def add_domain_response(self, response: dict) -> None:
-            """
-            Handle the response from the server after attempting to add a domain.
-            
-            Args:
-                response: Dictionary containing the server's response with code and content.
-            """
-            try:
-                match response[STR_CODE]:
-                    case Codes.CODE_SUCCESS:
-                        domain = response[STR_CONTENT]
-                        self.domains_listbox.insert(tk.END, domain)
-                        self.domain_entry.delete(0, tk.END)
-                            
-                        self._show_success(
-                            message=f"Domain '{domain}' added successfully",
-                            operation=STR_ADD_DOMAIN_RESPONSE
-                        )
-
-                    case Codes.CODE_ERROR:
-                        self._show_error(
-                            message=response[STR_CONTENT],
-                            operation=STR_ADD_DOMAIN_RESPONSE
-                        )
-                
-            except Exception as e:
+        """
+        Handle the response from the server after attempting to add a domain.
+
+        Args:
+            response: Dictionary containing the server's response with code and content.
+        """
+        try:
+            code = response[STR_CODE]
+            if code == _SUCCESS:
+                domain = intern(response[STR_CONTENT])
+                index = bisect_left(self._sorted_domains, domain)
+                self._sorted_domains.insert(index, domain)
+                self.domains_listbox.insert(index, domain)
+                self._blocked_domains.add(domain)
+                self._domains_cache = None
+                self.domain_entry.delete(0, _END)
+
+                self._show_success(
+                    message=f"Domain '{domain}' added successfully",
+                    operation=STR_ADD_DOMAIN_RESPONSE
+                )
+            elif code == _ERROR:
                 self._show_error(
-                    message="An unexpected error occurred",
-                    operation=f"Processing add domain response: {str(e)}"
+                    message=response[STR_CONTENT],
+                    operation=STR_ADD_DOMAIN_RESPONSE
                 )
 
+        except Exception as e:
+            self._show_error(
+                message="An unexpected error occurred",
+                operation=f"Processing add domain response: {str(e)}"
+            )
+
     def ad_block_response(self, response: dict) -> None:
         """
         Handle the response from the server after changing ad block setting.
@@ -144,18 +197,18 @@ class Viewer:
         prev_state = "off" if self.ad_var.get() == "on" else "on"
         
         try:
-            match response[STR_CODE]:
-                case Codes.CODE_SUCCESS:
-                    self._show_success(
-                        message=f"Ad blocking turned {self.ad_var.get()}",
-                        operation=STR_AD_BLOCK_RESPONSE
-                    )
-                case Codes.CODE_ERROR:
-                    self.ad_var.set(prev_state)
-                    self._show_error(
-                        message=response[STR_CONTENT],
-                        operation=STR_AD_BLOCK_RESPONSE
-                    )
+            code = response[STR_CODE]
+            if code == _SUCCESS:
+                self._show_success(
+                    message=f"Ad blocking turned {self.ad_var.get()}",
+                    operation=STR_AD_BLOCK_RESPONSE
+                )
+            elif code == _ERROR:
+                self.ad_var.set(prev_state)
+                self._show_error(
+                    message=response[STR_CONTENT],
+                    operation=STR_AD_BLOCK_RESPONSE
+                )
         except Exception as e:
             self.ad_var.set(prev_state)
             self._show_error(
@@ -173,18 +226,18 @@ class Viewer:
         prev_state = "off" if self.adult_var.get() == "on" else "on"
         
         try:
-            match response[STR_CODE]:
-                case Codes.CODE_SUCCESS:
-                    self._show_success(
-                        message=f"Adult content blocking turned {self.adult_var.get()}",
-                        operation=STR_ADULT_BLOCK_RESPONSE
-                    )
-                case Codes.CODE_ERROR:
-                    self.adult_var.set(prev_state)
-                    self._show_error(
-                        message=response[STR_CONTENT],
-                        operation=STR_ADULT_BLOCK_RESPONSE
-                    )
+            code = response[STR_CODE]
+            if code == _SUCCESS:
+                self._show_success(
+                    message=f"Adult content blocking turned {self.adult_var.get()}",
+                    operation=STR_ADULT_BLOCK_RESPONSE
+                )
+            elif code == _ERROR:
+                self.adult_var.set(prev_state)
+                self._show_error(
+                    message=response[STR_CONTENT],
+                    operation=STR_ADULT_BLOCK_RESPONSE
+                )
         except Exception as e:
             self.adult_var.set(prev_state)
             self._show_error(
@@ -200,19 +253,25 @@ class Viewer:
             response: Dictionary containing the server's response with code and content.
         """
         try:
-            match response[STR_CODE]:
-                case Codes.CODE_SUCCESS:
-                    domain = response[STR_CONTENT]
-                    self.domains_listbox.delete(self.domains_listbox.curselection())
-                    self._show_success(
-                        message=f"Domain '{domain}' removed successfully",
-                        operation=STR_REMOVE_DOMAIN_RESPONSE
-                    )
-                case Codes.CODE_ERROR:
-                    self._show_error(
-                        message=response[STR_CONTENT],
-                        operation=STR_REMOVE_DOMAIN_RESPONSE
-                    )
+            code = response[STR_CODE]
+            if code == _SUCCESS:
+                domain = response[STR_CONTENT]
+                index = bisect_left(self._sorted_domains, domain)
+                if (index < len(self._sorted_domains)
+                        and self._sorted_domains[index] == domain):
+                    del self._sorted_domains[index]
+                    self.domains_listbox.delete(index)
+                self._blocked_domains.discard(domain)
+                self._domains_cache = None
+                self._show_success(
+                    message=f"Domain '{domain}' removed successfully",
+                    operation=STR_REMOVE_DOMAIN_RESPONSE
+                )
+            elif code == _ERROR:
+                self._show_error(
+                    message=response[STR_CONTENT],
+                    operation=STR_REMOVE_DOMAIN_RESPONSE
+                )
         except Exception as e:
             self._show_error(
                 message="An unexpected error occurred",
@@ -229,9 +288,11 @@ class Viewer:
                      - settings: Dictionary with ad_block and adult_block states
         """
         try:
-            self.root.after(0, lambda: self.update_domain_list_response(response[STR_DOMAINS]))
-            self.root.after(0, lambda: self._update_block_settings(response[STR_SETTINGS]))
-            
+            # Already on the Tk thread - Application marshals inbound
+            # responses through root.after before they reach the view.
+            self.update_domain_list_response(response[STR_DOMAINS])
+            self._update_block_settings(response[STR_SETTINGS])
+
             self.logger.info("Successfully initialized settings from server")
             
         except Exception as e:
@@ -242,14 +303,20 @@ class Viewer:
     
     def _add_domain_request(self) -> None:
         """Add a domain to the blocked sites list."""
-        domain = self.domain_entry.get().strip()
-        
+        # The entry validator should keep whitespace out, but strip here
+        # anyway so a validator gap can never leak padding to the server.
+        domain = self._domain_var.get().strip()
+
         if domain:
-            self.logger.debug(f"Sending add domain request for: {domain}")
-            self._message_callback(json.dumps({
-                STR_CODE: Codes.CODE_ADD_DOMAIN,
-                STR_CONTENT: domain
-                }))
+            if domain in self._blocked_domains:
+                self._show_error(
+                    message=ERR_DUPLICATE_DOMAIN,
+                    operation=STR_ADD_DOMAIN_REQUEST
+                )
+                return
+
+            self.logger.debug("Sending add domain request for: %s", domain)
+            self._message_callback(_build_message(Codes.CODE_ADD_DOMAIN, domain))
         else:
             self._show_error(
                 message="Please enter a domain name",
@@ -261,12 +328,11 @@ class Viewer:
         selection = self.domains_listbox.curselection()
         
         if selection:
-            domain = self.domains_listbox.get(selection)
-            self.logger.debug(f"Sending remove domain request for: {domain}")
-            self._message_callback(json.dumps({
-                STR_CODE: Codes.CODE_REMOVE_DOMAIN,
-                STR_CONTENT: domain
-            }))
+            # The Python mirror matches the listbox row for row, so index
+            # into it rather than spending another Tcl call on .get().
+            domain = self._sorted_domains[selection[0]]
+            self.logger.debug("Sending remove domain request for: %s", domain)
+            self._message_callback(_build_message(Codes.CODE_REMOVE_DOMAIN, domain))
         else:
             self._show_error(
                 message=ERR_NO_DOMAIN_SELECTED,
@@ -276,22 +342,16 @@ class Viewer:
     def _handle_ad_block_request(self) -> None:
         """Handle changes to the ad block setting."""
         state = self.ad_var.get()
-        self.logger.debug(f"Sending ad block request: {state}")
+        self.logger.debug("Sending ad block request: %s", state)
 
-        self._message_callback(json.dumps({
-            STR_CODE: Codes.CODE_AD_BLOCK,
-            STR_CONTENT: state
-        }))
+        self._message_callback(_build_message(Codes.CODE_AD_BLOCK, state))
 
     def _handle_adult_block_request(self) -> None:
         """Handle changes to the adult sites block setting."""
         state = self.adult_var.get()
-        self.logger.debug(f"Sending adult block request: {state}")
+        self.logger.debug("Sending adult block request: %s", state)
 
-        self._message_callback(json.dumps({
-            STR_CODE: Codes.CODE_ADULT_BLOCK,
-            STR_CONTENT: state
-        }))
+        self._message_callback(_build_message(Codes.CODE_ADULT_BLOCK, state))
 
     def _update_block_settings(self, settings: dict) -> None:
         """Update the block settings radio buttons."""
@@ -325,7 +385,38 @@ class Viewer:
         """
         log_message = f"Operation successful: {operation}" if operation else message
         self.logger.info(log_message)
-        tk.messagebox.showinfo(STR_SUCCESS, message)
+        self._show_toast(message)
+
+    def _show_toast(self, message: str) -> None:
+        """
+        Display a transient in-window notification.
+
+        Unlike a messagebox, this neither blocks the calling thread nor
+        steals focus; the label removes itself after a short delay.
+
+        Args:
+            message: The text to display.
+        """
+        toast = tk.Label(
+            self.root,
+            text=message,
+            background='#333333',
+            foreground='white',
+            padx=12,
+            pady=6
+        )
+        toast.place(relx=0.5, rely=1.0, anchor=tk.S, y=-15)
+        toast.after(TOAST_DURATION_MS, toast.destroy)
+
+    def _configure_styles(self) -> None:
+        """Configure every ttk style once, on a single Style instance."""
+        style = ttk.Style()
+        style.configure('TLabelframe', padding=10)
+        style.configure('TLabelframe.Label', font=('Arial', 10, 'bold'))
+        style.configure('TButton', padding=5)
+        style.configure('TRadiobutton', font=('Arial', 10))
+        style.configure('TLabel', font=('Arial', 10))
+        style.configure('Action.TButton', padding=5)
 
     def _setup_ui(self) -> None:
         """Set up the UI components including block controls and domain list."""
@@ -353,9 +444,12 @@ class Viewer:
         listbox_frame = ttk.Frame(sites_frame)
         listbox_frame.grid(row=0, column=0, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        # Domains listbox with scrollbars
+        # Domains listbox with scrollbars, backed by a list variable so
+        # bulk refreshes are a single assignment.
+        self._domains_var = tk.StringVar()
         self.domains_listbox = tk.Listbox(
             listbox_frame,
+            listvariable=self._domains_var,
             width=40,
             height=15,
             selectmode=tk.SINGLE,
@@ -398,9 +492,15 @@ class Viewer:
             font=('Arial', 10)
         ).grid(row=0, column=0, padx=5)
         
+        # Entry edits are validated against the prospective full value in
+        # Tk itself, so whitespace is rejected before it lands in the box.
+        self._domain_var = tk.StringVar()
         self.domain_entry = ttk.Entry(
             domain_entry_frame,
-            font=('Arial', 10)
+            font=('Arial', 10),
+            textvariable=self._domain_var,
+            validate='key',
+            validatecommand=(self.root.register(_is_valid_domain_value), '%P')
         )
         self.domain_entry.grid(
             row=0,
@@ -418,9 +518,6 @@ class Viewer:
             sticky=(tk.W, tk.E)
         )
         
-        style = ttk.Style()
-        style.configure('Action.TButton', padding=5)
-        
         ttk.Button(
             button_frame,
             text="Add Domain",
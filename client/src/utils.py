@@ -1,5 +1,23 @@
 """Utility module containing constants and common functions for the application."""
 
+# JSON helpers - orjson parses/serializes several times faster than the
+# stdlib; fall back to the stdlib when it is not installed.
+try:
+    import orjson
+
+    def json_loads(data):
+        """Parse a JSON document from a str or bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj) -> str:
+        """Serialize an object to a JSON string."""
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    import json
+
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 # Network related constants
 DEFAULT_HOST: str = "127.0.0.1"
 DEFAULT_PORT: str = "65432"
@@ -10,6 +28,7 @@ WINDOW_TITLE    = "Site Blocker"
 WINDOW_SIZE     = "800x600"
 PADDING_SMALL   = "5"
 PADDING_MEDIUM  = "10"
+TOAST_DURATION_MS = 2500
 
 # Message codes
 class Codes:
@@ -27,6 +46,9 @@ class Codes:
 LOG_DIR          = "client_logs"
 LOG_FORMAT       = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT  = "%Y%m%d_%H%M%S"
+LOG_MAX_BYTES    = 1_048_576
+LOG_BACKUP_COUNT = 3
+LOG_BUFFER_RECORDS = 64
 
 # Error messages
 ERR_SOCKET_NOT_SETUP          = "Socket not set up. Call connect method first."
@@ -0,0 +1,30 @@
+"""Shared fixtures for the client test suite."""
+
+import pytest
+from unittest import mock
+from typing import Callable
+
+from src.ConfigManager import ConfigManager
+from src.utils import DEFAULT_CONFIG
+
+@pytest.fixture(scope="session")
+def mock_callback() -> Callable[[str], None]:
+    """Fixture to provide a mock callback function."""
+    return mock.Mock()
+
+@pytest.fixture(scope="session")
+def mock_config_manager() -> mock.Mock:
+    """Fixture to provide a mock configuration manager."""
+    config_manager = mock.Mock(spec=ConfigManager)
+    config_manager.get_config.return_value = DEFAULT_CONFIG
+    return config_manager
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks(
+    mock_callback: mock.Mock,
+    mock_config_manager: mock.Mock
+) -> None:
+    """Reset the session-scoped mocks so call history never leaks between tests."""
+    mock_callback.reset_mock()
+    mock_config_manager.reset_mock()
+    mock_config_manager.get_config.return_value = DEFAULT_CONFIG
@@ -1,4 +1,5 @@
 import json
+import logging
 import pytest
 from unittest import mock
 from typing import Dict, Any
@@ -6,32 +7,56 @@ from typing import Dict, Any
 from src.Application import Application
 from src.utils import (
     STR_CODE, STR_CONTENT, STR_OPERATION, STR_DOMAINS,
-    Codes, DEFAULT_CONFIG
+    Codes
 )
 
-@pytest.fixture
-def mock_config_manager() -> mock.Mock:
-    """Fixture to provide a mock configuration manager."""
-    config_manager = mock.Mock()
-    config_manager.get_config.return_value = DEFAULT_CONFIG.copy()
-    return config_manager
+@pytest.fixture(scope="module")
+def _patched_app_deps() -> tuple:
+    """Patch Application's collaborators once for the whole module."""
+    with mock.patch('src.Application.Viewer') as mock_viewer, \
+         mock.patch('src.Application.Communicator') as mock_comm, \
+         mock.patch('src.Application.setup_logger') as mock_setup_logger:
+        yield mock_viewer, mock_comm, mock_setup_logger
 
 @pytest.fixture
-def application(mock_config_manager: mock.Mock) -> Application:
+def application(_patched_app_deps: tuple, mock_config_manager: mock.Mock) -> Application:
     """Fixture to create an Application instance with mocked components."""
-    with mock.patch('src.Application.Viewer') as mock_viewer, \
-         mock.patch('src.Application.Communicator') as mock_comm, \
-         mock.patch('src.Application.setup_logger'):
-        app = Application()
-        app._logger = mock.Mock()
-        app._config_manager = mock_config_manager
-        return app
+    for patched in _patched_app_deps:
+        patched.reset_mock(return_value=True, side_effect=True)
 
-def test_init(application: Application) -> None:
+    app = Application()
+    app._logger = mock.Mock(spec=logging.Logger)
+    app._config_manager = mock_config_manager
+    return app
+
+@pytest.mark.parametrize("attr", ['_logger', '_communicator', '_config_manager'])
+def test_init(application: Application, attr: str) -> None:
     """Test the initialization of Application."""
-    assert hasattr(application, '_logger')
-    assert hasattr(application, '_communicator')
-    assert hasattr(application, '_config_manager')
+    assert hasattr(application, attr)
+
+def test_run_success(application: Application) -> None:
+    """Test the happy-path run sequence."""
+    application._start_communication = mock.Mock()
+    application._start_gui = mock.Mock()
+    application._cleanup = mock.Mock()
+
+    application.run()
+
+    application._start_communication.assert_called_once()
+    application._start_gui.assert_called_once()
+    application._cleanup.assert_called_once()
+
+def test_run_exception(application: Application) -> None:
+    """Test that run re-raises startup failures and still cleans up."""
+    application._start_communication = mock.Mock()
+    application._start_gui = mock.Mock(side_effect=Exception("Test Exception"))
+    application._cleanup = mock.Mock()
+
+    with pytest.raises(Exception, match="Test Exception"):
+        application.run()
+
+    application._logger.error.assert_called()
+    application._cleanup.assert_called_once()
 
 def test_handle_request_ad_block(application: Application) -> None:
     """Test handling ad block request."""
@@ -42,10 +67,11 @@ def test_handle_request_ad_block(application: Application) -> None:
     
     application._communicator.send_message = mock.Mock()
     application._handle_request(json.dumps(test_request))
-    
+    application._send_queue.join()
+
     application._communicator.send_message.assert_called_once()
     sent_data = application._communicator.send_message.call_args[0][0]
-    assert sent_data == test_request
+    assert json.loads(sent_data) == test_request
 
 def test_handle_request_domain_list_update(application: Application) -> None:
     """Test handling domain list update request."""
@@ -56,6 +82,9 @@ def test_handle_request_domain_list_update(application: Application) -> None:
         STR_OPERATION: Codes.CODE_DOMAIN_LIST_UPDATE
     }
     
+    # Run callbacks scheduled on the Tk event queue immediately.
+    application._view.root.after.side_effect = lambda delay, fn, *args: fn(*args)
+
     application._handle_request(json.dumps(test_request), to_server=False)
     application._view.update_domain_list_response.assert_called_once_with(test_domains)
 
@@ -67,9 +96,9 @@ def test_cleanup(application: Application) -> None:
 def test_handle_request_invalid_json(application: Application) -> None:
     """Test handling invalid JSON in request."""
     invalid_json = "{"
-    
+
     with pytest.raises(json.JSONDecodeError):
-        application._handle_request(invalid_json)
-    
+        application._handle_request(invalid_json, to_server=False)
+
     application._logger.error.assert_called()
     
\ No newline at end of file
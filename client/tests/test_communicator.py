@@ -1,3 +1,10 @@
+"""Unit tests for the Communicator class.
+
+PYTEST_DONT_REWRITE - assertions here are mock-based or compare simple
+scalars, so skipping pytest's assertion rewriting saves collection-time
+AST work without losing useful failure messages.
+"""
+
 import socket
 import pytest
 from unittest import mock
@@ -10,17 +17,38 @@ from src.utils import (
     STR_NETWORK, STR_HOST, STR_PORT, STR_RECEIVE_BUFFER_SIZE
 )
 
-@pytest.fixture
-def mock_config_manager() -> mock.Mock:
-    """Fixture to provide a mock configuration manager."""
-    config_manager = mock.Mock()
-    config_manager.get_config.return_value = DEFAULT_CONFIG
-    return config_manager
+# Expected network settings, resolved once at import instead of per test.
+_NETWORK = DEFAULT_CONFIG[STR_NETWORK]
+_HOST = _NETWORK[STR_HOST]
+_PORT = int(_NETWORK[STR_PORT])
+_BUFFER_SIZE = int(_NETWORK[STR_RECEIVE_BUFFER_SIZE])
 
-@pytest.fixture
-def mock_callback() -> Callable[[str], None]:
-    """Fixture to provide a mock callback function."""
-    return mock.Mock()
+# A complete frame that is not valid UTF-8; a literal so it costs nothing
+# to build at test time. Receive scripts are tuples: immutable, shareable
+# across tests, and consumed through an iterator closure.
+_INVALID_UTF8_FRAMES = (b'\xff\xfe\xfd\n',)
+
+def _scripted_recv_into(frames: tuple) -> Callable[[bytearray], int]:
+    """Build a recv_into stand-in that plays back the given frames, then EOF."""
+    frames_iter = iter(frames)
+
+    def recv_into(buffer: bytearray) -> int:
+        data = next(frames_iter, b'')
+        buffer[:len(data)] = data
+        return len(data)
+
+    return recv_into
+
+@pytest.fixture(scope="module")
+def _no_real_socket() -> mock.Mock:
+    """Patch socket.socket once for the whole module; no test opens a real socket."""
+    with mock.patch('socket.socket') as mock_socket_class:
+        yield mock_socket_class
+
+@pytest.fixture(autouse=True)
+def _reset_socket_mock(_no_real_socket: mock.Mock) -> None:
+    """Reset the module-scoped socket mock between tests."""
+    _no_real_socket.reset_mock(return_value=True, side_effect=True)
 
 @pytest.fixture
 def communicator(
@@ -33,52 +61,80 @@ def communicator(
         message_callback=mock_callback
     )
 
-def test_init(communicator: Communicator, mock_callback: Callable[[str], None]) -> None:
-    """Test initialization of Communicator."""
-    config = DEFAULT_CONFIG[STR_NETWORK]
-    assert communicator._host == config[STR_HOST]
-    assert communicator._port == int(config[STR_PORT])
-    assert communicator._receive_buffer_size == int(config[STR_RECEIVE_BUFFER_SIZE])
-    assert communicator._socket is None
-    assert communicator._message_callback == mock_callback
+@pytest.mark.parametrize("attr,expected", [
+    ("_host", _HOST),
+    ("_port", _PORT),
+    ("_receive_buffer_size", _BUFFER_SIZE),
+    ("_socket", None),
+])
+def test_init_attr(communicator: Communicator, attr: str, expected: object) -> None:
+    """Test each attribute initialized by Communicator."""
+    assert getattr(communicator, attr) == expected
 
-@mock.patch('socket.socket')
-def test_connect(mock_socket_class: mock.Mock, communicator: Communicator) -> None:
+def test_init_callback(
+    communicator: Communicator,
+    mock_callback: Callable[[str], None]
+) -> None:
+    """Test that the message callback is stored as given."""
+    assert communicator._message_callback is mock_callback
+
+def test_connect(communicator: Communicator, _no_real_socket: mock.Mock) -> None:
     """Test socket connection."""
-    mock_socket_instance = mock_socket_class.return_value
+    mock_socket_instance = _no_real_socket.return_value
     communicator.connect()
     
-    mock_socket_class.assert_called_once_with(socket.AF_INET, socket.SOCK_STREAM)
+    _no_real_socket.assert_called_once_with(socket.AF_INET, socket.SOCK_STREAM)
     mock_socket_instance.connect.assert_called_once_with(
         (communicator._host, communicator._port)
     )
     assert communicator._socket is mock_socket_instance
 
-@mock.patch('socket.socket')
-def test_send_message_without_setup(
-    mock_socket_class: mock.Mock,
-    communicator: Communicator
+@pytest.mark.parametrize("method,args", [
+    ("send_message", ("test message",)),
+    ("receive_message", ()),
+])
+def test_operation_without_setup(
+    communicator: Communicator,
+    method: str,
+    args: tuple
 ) -> None:
-    """Test sending message without socket setup."""
+    """Test that socket operations fail cleanly without a connection."""
     with pytest.raises(RuntimeError) as exc_info:
-        communicator.send_message("test message")
+        getattr(communicator, method)(*args)
     assert str(exc_info.value) == ERR_SOCKET_NOT_SETUP
 
-@mock.patch('socket.socket')
-def test_send_message(mock_socket_class: mock.Mock, communicator: Communicator) -> None:
+def test_send_message(communicator: Communicator, _no_real_socket: mock.Mock) -> None:
     """Test sending message successfully."""
-    mock_socket_instance = mock_socket_class.return_value
+    mock_socket_instance = _no_real_socket.return_value
     communicator._socket = mock_socket_instance
     
     message = {"test": "message"}
     communicator.send_message(message)
     
-    mock_socket_instance.send.assert_called_once_with(json.dumps(message).encode('utf-8'))
+    mock_socket_instance.sendall.assert_called_once_with(
+        json.dumps(message).encode('utf-8') + b'\n'
+    )
+
+def test_receive_message_decode_error(
+    communicator: Communicator,
+    _no_real_socket: mock.Mock
+) -> None:
+    """Test that a frame with invalid UTF-8 raises UnicodeDecodeError."""
+    mock_socket_instance = _no_real_socket.return_value
+    communicator._socket = mock_socket_instance
+
+    mock_socket_instance.recv_into.side_effect = _scripted_recv_into(_INVALID_UTF8_FRAMES)
+
+    # The mock socket has no real file descriptor, so stub the selector
+    # module and report the socket as always readable.
+    with mock.patch('src.Communicator.selectors') as mock_selectors:
+        mock_selectors.DefaultSelector.return_value.select.return_value = [mock.Mock()]
+        with pytest.raises(UnicodeDecodeError):
+            communicator.receive_message()
 
-@mock.patch('socket.socket')
-def test_close_socket(mock_socket_class: mock.Mock, communicator: Communicator) -> None:
+def test_close_socket(communicator: Communicator, _no_real_socket: mock.Mock) -> None:
     """Test closing socket connection."""
-    mock_socket_instance = mock_socket_class.return_value
+    mock_socket_instance = _no_real_socket.return_value
     communicator._socket = mock_socket_instance
     
     communicator.close()
@@ -1,5 +1,6 @@
 """Unit tests for the Viewer class."""
 
+import logging
 import pytest
 from unittest import mock
 import json
@@ -11,22 +12,9 @@ from src.utils import (
     STR_AD_BLOCK, STR_ADULT_BLOCK
 )
 
-@pytest.fixture
-def mock_config_manager() -> mock.Mock:
-    """Create a mock configuration manager fixture."""
-    config_manager = mock.Mock()
-    config_manager.get_config.return_value = {
-        "network": {
-            "host": "127.0.0.1",
-            "port": 65432
-        }
-    }
-    return config_manager
-
-@pytest.fixture
-def mock_callback() -> mock.Mock:
-    """Create a mock callback function fixture."""
-    return mock.Mock()
+# Expected request payloads, built once at import instead of per test.
+_EXPECTED_AD_PAYLOAD = {STR_CODE: Codes.CODE_AD_BLOCK, STR_CONTENT: "on"}
+_EXPECTED_ADULT_PAYLOAD = {STR_CODE: Codes.CODE_ADULT_BLOCK, STR_CONTENT: "on"}
 
 @pytest.fixture
 def mock_tk() -> mock.Mock:
@@ -58,7 +46,7 @@ def viewer(
     with mock.patch('src.View.ttk'), \
          mock.patch('src.View.messagebox'), \
          mock.patch('src.View.setup_logger') as mock_logger:
-        logger_instance = mock.Mock()
+        logger_instance = mock.Mock(spec=logging.Logger)
         mock_logger.return_value = logger_instance
         
         viewer = Viewer(
@@ -74,25 +62,17 @@ def viewer(
         
         return viewer
 
-def test_handle_ad_block_request(viewer: Viewer) -> None:
-    """Test handling ad block request message formation."""
-    expected_message = json.dumps({
-        STR_CODE: Codes.CODE_AD_BLOCK,
-        STR_CONTENT: "on"
-    })
-    
-    viewer._handle_ad_block_request()
-    viewer._message_callback.assert_called_once_with(expected_message)
+@pytest.mark.parametrize("method,expected", [
+    ("_handle_ad_block_request", _EXPECTED_AD_PAYLOAD),
+    ("_handle_adult_block_request", _EXPECTED_ADULT_PAYLOAD),
+])
+def test_handle_block_request(viewer: Viewer, method: str, expected: Dict[str, str]) -> None:
+    """Test block request message formation for both toggles."""
+    getattr(viewer, method)()
 
-def test_handle_adult_block_request(viewer: Viewer) -> None:
-    """Test handling adult block request message formation."""
-    expected_message = json.dumps({
-        STR_CODE: Codes.CODE_ADULT_BLOCK,
-        STR_CONTENT: "on"
-    })
-    
-    viewer._handle_adult_block_request()
-    viewer._message_callback.assert_called_once_with(expected_message)
+    viewer._message_callback.assert_called_once()
+    sent_message = viewer._message_callback.call_args[0][0]
+    assert json.loads(sent_message) == expected
 
 def test_update_initial_settings(viewer: Viewer) -> None:
     """Test updating initial settings from server response."""
@@ -112,7 +92,9 @@ def test_update_domain_list_response(viewer: Viewer) -> None:
     test_domains = ["domain1.com", "domain2.com"]
     
     viewer.update_domain_list_response(test_domains)
-    viewer.logger.info.assert_called_with(f"Updated domain list with {len(test_domains)} domains")
+    viewer.logger.info.assert_called_with(
+        "Updated domain list with %d domains", len(test_domains)
+    )
 
 @pytest.mark.parametrize("response,expected_log", [
     (
@@ -147,6 +129,7 @@ def test_add_domain_response(
 def test_get_blocked_domains(viewer: Viewer) -> None:
     """Test getting list of blocked domains."""
     expected_domains = ["domain1.com", "domain2.com"]
+    viewer.update_domain_list_response(expected_domains)
     domains = list(viewer.get_blocked_domains())
     assert domains == expected_domains
 